@@ -13,28 +13,49 @@ Usage:
 """
 
 import argparse
+import asyncio
 import logging
+import sqlite3
 import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Set
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.utils.config import load_config
 from src.utils.logging_setup import setup_logging
-from src.scraper.listing_scraper import ListingScraper
+from src.models.event import Event
+from src.scraper.base import create_client
+from src.scraper.listing_scraper import EventLink, ListingScraper
 from src.scraper.detail_scraper import DetailScraper
+from src.scraper.rate_limiter import RateLimiter
 from src.storage.database import Database
 from src.storage.json_export import export_to_json
 
 
+# Number of scraped events to collect before writing them to the database
+UPSERT_BATCH_SIZE = 500
+
+# Maximum number of scraped events waiting for the database writer
+WRITE_QUEUE_SIZE = 2000
+
 # Dutch month names for URL construction
 DUTCH_MONTHS = [
     'januari', 'februari', 'maart', 'april', 'mei', 'juni',
     'juli', 'augustus', 'september', 'oktober', 'november', 'december'
 ]
 
+# Two years back to back, so a run of months across new year is a single slice
+DUTCH_MONTHS_RING = tuple(DUTCH_MONTHS + DUTCH_MONTHS)
+
 
 def get_months_to_scrape(config: dict) -> list:
     """
@@ -62,22 +83,151 @@ def get_months_to_scrape(config: dict) -> list:
 
     elif selection.startswith('next_'):
         try:
-            count = int(selection.split('_')[1])
-            return [
-                DUTCH_MONTHS[(current_month_idx + i) % 12]
-                for i in range(count + 1)  # +1 to include current month
-            ]
+            count = min(int(selection.split('_')[1]), 11)
+            # +1 to include current month
+            return list(DUTCH_MONTHS_RING[current_month_idx:current_month_idx + count + 1])
         except (ValueError, IndexError):
             pass
 
     # Default to current + next 3 months
-    return [
-        DUTCH_MONTHS[(current_month_idx + i) % 12]
-        for i in range(4)
-    ]
+    return list(DUTCH_MONTHS_RING[current_month_idx:current_month_idx + 4])
+
+
+@dataclass
+class ScrapeStats:
+    """Counters for the end-of-run summary."""
+    total: int = 0
+    new: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    failed_pages: int = 0
 
 
-def main():
+async def db_writer(
+    queue: asyncio.Queue[Optional[Event]],
+    db: Database,
+    batch_size: int = UPSERT_BATCH_SIZE
+) -> None:
+    """
+    Consume scraped events and write them to the database in batches.
+
+    Being the only consumer, this serializes all SQLite writes. Batches are
+    written in a worker thread so scraping continues while SQLite commits.
+    A None on the queue flushes the remaining events and stops the writer.
+    When cancelled, the events received or still queued so far are written
+    before the cancellation propagates.
+
+    Args:
+        queue: Queue of scraped events, terminated by None.
+        db: Database to write to.
+        batch_size: Number of events per upsert transaction.
+
+    Raises:
+        sqlite3.Error: If a batch can't be written.
+    """
+    batch = []
+    try:
+        while True:
+            event = await queue.get()
+            if event is None:
+                break
+
+            batch.append(event)
+            if len(batch) >= batch_size:
+                await asyncio.to_thread(db.upsert_events, batch)
+                batch = []
+
+    except asyncio.CancelledError:
+        while not queue.empty():
+            event = queue.get_nowait()
+            if event is not None:
+                batch.append(event)
+        db.upsert_events(batch)
+        raise
+
+    await asyncio.to_thread(db.upsert_events, batch)
+
+
+@dataclass
+class ScrapeContext:
+    """State shared by all scraping tasks of a run."""
+    listing_scraper: ListingScraper
+    detail_scraper: DetailScraper
+    existing_ids: Set[int]
+    full_refresh: bool
+    queue: asyncio.Queue[Optional[Event]]
+    stats: ScrapeStats = field(default_factory=ScrapeStats)
+    # Events already scheduled in this run; an event can show up on several listings
+    scheduled_ids: Set[int] = field(default_factory=set)
+
+
+async def process_event(ctx: ScrapeContext, link: EventLink, was_existing: bool) -> None:
+    """Scrape a single detail page and queue the event for writing."""
+    logger = logging.getLogger('main')
+
+    try:
+        event = await ctx.detail_scraper.scrape_detail_page(link.url, link.id)
+    except Exception as e:
+        # Counted as failed below; one bad page must not stop the run
+        logger.error(f"Error scraping event {link.id}: {e}")
+        event = None
+
+    if event:
+        ctx.existing_ids.add(link.id)
+        await ctx.queue.put(event)
+
+        if was_existing:
+            ctx.stats.updated += 1
+            logger.info(f"Updated: {event.naam} ({event.gemeente})")
+        else:
+            ctx.stats.new += 1
+            logger.info(f"Added: {event.naam} ({event.gemeente})")
+    else:
+        ctx.stats.failed += 1
+        logger.warning(f"Failed to scrape event {link.id}")
+
+
+async def process_pair(ctx: ScrapeContext, province: str, month: str) -> None:
+    """
+    Scrape one listing page and the detail pages of the events on it.
+
+    Args:
+        ctx: Shared state of the run.
+        province: Province name in Dutch.
+        month: Month name in Dutch.
+    """
+    logger = logging.getLogger('main')
+    logger.info(f"Scraping: {month} in {province}")
+
+    # Get list of events from listing page; one bad page must not stop the run
+    try:
+        event_links = await ctx.listing_scraper.scrape_listing_page(province, month)
+    except Exception as e:
+        ctx.stats.failed_pages += 1
+        logger.error(f"Error scraping listing {month} in {province}: {e}")
+        return
+
+    if not event_links:
+        logger.warning(f"No events found for {month} in {province}")
+        return
+
+    # Scrape detail pages concurrently (unless already known)
+    async with asyncio.TaskGroup() as tg:
+        for link in event_links:
+            ctx.stats.total += 1
+
+            already = link.id in ctx.existing_ids
+            if link.id in ctx.scheduled_ids or (not ctx.full_refresh and already):
+                logger.debug("Skipping existing event %s", link.id)
+                ctx.stats.skipped += 1
+                continue
+
+            ctx.scheduled_ids.add(link.id)
+            tg.create_task(process_event(ctx, link, already))
+
+
+async def main():
     """Main entry point for the scraper."""
     parser = argparse.ArgumentParser(
         description='Rommelmarkten.be Web Scraper',
@@ -155,72 +305,71 @@ Examples:
     # Merge base_url into scraping config for scrapers
     scraping_config = config['scraping'].copy()
     scraping_config['base_url'] = config['target']['base_url']
+    scraping_config['http_cache_path'] = config['storage']['http_cache_path']
+
+    # One client and limiter for both scrapers: a single connection pool,
+    # and delay_seconds and concurrency apply to the host as a whole
+    client = create_client(scraping_config)
+    limiter = RateLimiter(scraping_config['delay_seconds'], scraping_config['concurrency'])
+    listing_scraper = ListingScraper(scraping_config, limiter, client)
+    detail_scraper = DetailScraper(scraping_config, limiter, client)
+    listing_scraper.prepare(provinces)
+
+    # Scraped events flow through this queue to a single database writer
+    queue: asyncio.Queue[Optional[Event]] = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+
+    # Known event IDs are tracked in memory; this run is the only writer
+    ctx = ScrapeContext(
+        listing_scraper=listing_scraper,
+        detail_scraper=detail_scraper,
+        existing_ids=db.get_all_event_ids(),
+        full_refresh=args.full_refresh,
+        queue=queue,
+    )
+    stats = ctx.stats
 
-    listing_scraper = ListingScraper(scraping_config)
-    detail_scraper = DetailScraper(scraping_config)
+    write_failed = False
+    try:
+        # The writer runs in the same task group as the scrapers, so if it
+        # fails, scraping is cancelled instead of blocking on a full queue
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(db_writer(queue, db))
 
-    # Statistics
-    total_events = 0
-    new_events = 0
-    updated_events = 0
-    skipped_events = 0
-    failed_events = 0
+            # Fan out all listing pages over the shared connection pool
+            async with asyncio.TaskGroup() as pairs_tg:
+                for province in provinces:
+                    for month in months:
+                        pairs_tg.create_task(process_pair(ctx, province, month))
 
-    try:
-        for province in provinces:
-            for month in months:
-                logger.info("-" * 40)
-                logger.info(f"Scraping: {month} in {province}")
-
-                # Get list of events from listing page
-                event_links = listing_scraper.scrape_listing_page(province, month)
-
-                if not event_links:
-                    logger.warning(f"No events found for {month} in {province}")
-                    continue
-
-                for link in event_links:
-                    total_events += 1
-
-                    # Check if event already exists (unless full refresh)
-                    if not args.full_refresh and db.event_exists(link.id):
-                        logger.debug(f"Skipping existing event {link.id}")
-                        skipped_events += 1
-                        continue
-
-                    # Scrape detail page
-                    event = detail_scraper.scrape_detail_page(link.url, link.id)
-
-                    if event:
-                        was_existing = db.event_exists(link.id)
-                        db.upsert_event(event)
-
-                        if was_existing:
-                            updated_events += 1
-                            logger.info(f"Updated: {event.naam} ({event.gemeente})")
-                        else:
-                            new_events += 1
-                            logger.info(f"Added: {event.naam} ({event.gemeente})")
-                    else:
-                        failed_events += 1
-                        logger.warning(f"Failed to scrape event {link.id}")
+            # Let the writer flush the remaining events
+            await queue.put(None)
 
-    except KeyboardInterrupt:
+    except* (KeyboardInterrupt, asyncio.CancelledError):
         logger.warning("Scraping interrupted by user")
 
+    except* sqlite3.Error as eg:
+        logger.error(f"Database write failed, scraping stopped: {eg.exceptions[0]}")
+        write_failed = True
+
     finally:
         # Close scrapers
-        listing_scraper.close()
-        detail_scraper.close()
+        await listing_scraper.close()
+        await detail_scraper.close()
+        await client.aclose()
+
+    if write_failed:
+        db.close()
+        sys.exit(1)
 
     # Print summary
     logger.info("=" * 60)
     logger.info("Scraping complete!")
-    logger.info(f"  Total events found: {total_events}")
-    logger.info(f"  New events added: {new_events}")
-    logger.info(f"  Events updated: {updated_events}")
-    logger.info(f"  Events skipped (existing): {skipped_events}")
-    logger.info(f"  Events failed: {failed_events}")
+    logger.info(f"  Total events found: {stats.total}")
+    logger.info(f"  New events added: {stats.new}")
+    logger.info(f"  Events updated: {stats.updated}")
+    logger.info(f"  Events skipped (existing): {stats.skipped}")
+    logger.info(f"  Events failed: {stats.failed}")
+    logger.info(f"  Listing pages failed: {stats.failed_pages}")
     logger.info(f"  Database total: {db.get_event_count()} events")
     logger.info("=" * 60)
 
@@ -230,6 +379,14 @@ Examples:
         filepath = export_to_json(db, export_path)
         logger.info(f"Exported to: {filepath}")
 
+    db.close()
+
 
 if __name__ == '__main__':
-    main()
+    # Use the libuv-based event loop when available
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    try:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
+    except KeyboardInterrupt:
+        sys.exit(130)
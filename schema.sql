@@ -22,12 +22,21 @@ CREATE TABLE IF NOT EXISTS events (
     afbeelding_url TEXT,
     source_url TEXT,
     first_scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    last_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    last_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    gemeente_norm TEXT       -- Lowercased, trimmed gemeente for lookups
+        GENERATED ALWAYS AS (lower(trim(gemeente))) VIRTUAL
 );
 
--- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_events_datum ON events(datum);
-CREATE INDEX IF NOT EXISTS idx_events_gemeente ON events(gemeente);
+-- Indexes for common queries. The date index is ordered by date, then id,
+-- and also holds the columns of event overviews, so listing events by date
+-- needs no table lookups or sorting.
+-- Gemeente lookups go through the normalized column, ordered by date.
+DROP INDEX IF EXISTS idx_events_datum;
+DROP INDEX IF EXISTS idx_events_gemeente;
+CREATE INDEX IF NOT EXISTS idx_events_datum_id_covering
+    ON events(datum, id, naam, gemeente, postcode);
+CREATE INDEX IF NOT EXISTS idx_events_gemeente_norm
+    ON events(gemeente_norm, datum);
 CREATE INDEX IF NOT EXISTS idx_events_postcode ON events(postcode);
 
 -- Track scraping history for debugging and auditing
@@ -1,14 +1,22 @@
-"""Pydantic model for rommelmarkt event data."""
+"""msgspec model for rommelmarkt event data."""
 
-from datetime import date, time
+import json
+from datetime import date
 from decimal import Decimal
-from typing import Optional, List
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
-from pydantic import BaseModel, Field
+import msgspec
+from msgspec.structs import astuple
 
 
-class Event(BaseModel):
-    """Represents a single rommelmarkt (flea market) event."""
+class Event(msgspec.Struct, kw_only=True):
+    """
+    Represents a single rommelmarkt (flea market) event.
+
+    Fields are declared in database column order, so the struct's own
+    tuple maps directly onto the events table.
+    """
 
     id: int
     naam: str
@@ -19,7 +27,7 @@ class Event(BaseModel):
     datum: Optional[date] = None
     start_tijd: Optional[str] = None  # Stored as string "HH:MM"
     eind_tijd: Optional[str] = None   # Stored as string "HH:MM"
-    types: List[str] = Field(default_factory=list)
+    types: List[str] = msgspec.field(default_factory=list)
     inkom_prijs: Optional[Decimal] = None
     standplaats_prijs: Optional[Decimal] = None
     organisator: Optional[str] = None
@@ -30,37 +38,40 @@ class Event(BaseModel):
     afbeelding_url: Optional[str] = None
     source_url: str
 
-    class Config:
-        """Pydantic model configuration."""
-
-        json_encoders = {
-            date: lambda v: v.isoformat() if v else None,
-            time: lambda v: v.strftime('%H:%M') if v else None,
-            Decimal: lambda v: float(v) if v else None,
-        }
-
     def to_db_tuple(self) -> tuple:
         """Convert event to tuple for database insertion."""
-        import json
+        return _to_db_row(astuple(self))
+
+    @classmethod
+    def batch_to_db_rows(cls, events: Iterable['Event']) -> List[tuple]:
+        """
+        Convert events to parameter rows for executemany.
+
+        Args:
+            events: Events to convert.
+
+        Returns:
+            List of tuples for database insertion.
+        """
+        return [_to_db_row(astuple(e)) for e in events]
+
+
+@lru_cache(maxsize=256)
+def _types_json(types: tuple) -> str:
+    """Serialize a types list; the same few combinations repeat across events."""
+    return json.dumps(list(types))
+
 
-        return (
-            self.id,
-            self.naam,
-            self.gemeente,
-            self.postcode,
-            self.adres,
-            self.locatie_naam,
-            self.datum.isoformat() if self.datum else None,
-            self.start_tijd,
-            self.eind_tijd,
-            json.dumps(self.types) if self.types else '[]',
-            float(self.inkom_prijs) if self.inkom_prijs is not None else None,
-            float(self.standplaats_prijs) if self.standplaats_prijs is not None else None,
-            self.organisator,
-            self.telefoon,
-            self.email,
-            self.website,
-            self.beschrijving,
-            self.afbeelding_url,
-            self.source_url,
-        )
+def _to_db_row(values: tuple) -> tuple:
+    """Convert the date, types and price fields of an Event tuple to SQLite types."""
+    datum, types, inkom_prijs, standplaats_prijs = values[6], values[9], values[10], values[11]
+    return (
+        *values[:6],
+        datum.isoformat() if datum else None,
+        values[7],
+        values[8],
+        _types_json(tuple(types)) if types else '[]',
+        float(inkom_prijs) if inkom_prijs is not None else None,
+        float(standplaats_prijs) if standplaats_prijs is not None else None,
+        *values[12:],
+    )
@@ -1,6 +1,11 @@
-from .base import BaseScraper
+from .base import BaseScraper, create_client
 from .listing_scraper import ListingScraper
 from .detail_scraper import DetailScraper
 from .email_decoder import decode_cloudflare_email
+from .http_cache import HttpCache
+from .rate_limiter import RateLimiter
 
-__all__ = ['BaseScraper', 'ListingScraper', 'DetailScraper', 'decode_cloudflare_email']
+__all__ = [
+    'BaseScraper', 'ListingScraper', 'DetailScraper', 'decode_cloudflare_email',
+    'HttpCache', 'RateLimiter', 'create_client',
+]
@@ -1,96 +1,242 @@
 """Base scraper class with rate limiting and retry logic."""
 
 import logging
-import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, Optional
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    before_sleep_log,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from .http_cache import HttpCache
+from .rate_limiter import RateLimiter
+
+
+# Status codes that are worth retrying after a backoff
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound for a server-requested Retry-After delay
+MAX_RETRY_AFTER_SECONDS = 300
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """
+    Read the delay a server asks for in its Retry-After header.
+
+    Args:
+        response: The response that was rejected.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get('Retry-After', '').strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+
+    # Otherwise an HTTP date, e.g. "Wed, 21 Oct 2015 07:28:00 GMT"
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def create_client(config: Dict[str, Any]) -> httpx.AsyncClient:
+    """
+    Create and configure an async HTTP client with keep-alive and HTTP/2.
+
+    Args:
+        config: Scraping configuration dictionary.
+
+    Returns:
+        Client whose connection pool is sized by the concurrency setting.
+    """
+    concurrency = max(1, int(config.get('concurrency', 4)))
+    return httpx.AsyncClient(
+        http2=True,
+        headers={
+            'User-Agent': config.get('user_agent', 'RommelmarktZoeker/1.0'),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'nl-BE,nl;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'br, gzip, deflate',
+        },
+        timeout=config.get('timeout_seconds', 30),
+        limits=httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        ),
+        follow_redirects=True,
+    )
 
 
 class BaseScraper:
-    """Base scraper with rate limiting, retry logic, and session management."""
+    """Base async scraper with rate limiting, retry logic, and client management."""
 
-    def __init__(self, config: Dict[str, Any]):
+    # Whether responses are kept in the HTTP cache for conditional GETs
+    USE_HTTP_CACHE = False
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        limiter: Optional[RateLimiter] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the base scraper.
 
         Args:
             config: Scraping configuration dictionary.
+            limiter: Rate limiter shared with other scrapers. If not given,
+                     a private one is created from delay_seconds and
+                     concurrency.
+            client: HTTP client shared with other scrapers. If not given,
+                    a private one is created and closed by close().
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.session = self._create_session()
-        self.last_request_time: float = 0
-
-    def _create_session(self) -> requests.Session:
-        """Create and configure a requests session with retry logic."""
-        session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.config.get('max_retries', 3),
-            backoff_factor=self.config.get('retry_delay_seconds', 5),
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD"],
+        self.concurrency = max(1, int(config.get('concurrency', 4)))
+        self._owns_client = client is None
+        self.client = client or create_client(config)
+
+        cache_path = config.get('http_cache_path') if self.USE_HTTP_CACHE else None
+        self.cache: Optional[HttpCache] = HttpCache(cache_path) if cache_path else None
+
+        self.limiter = limiter or RateLimiter(
+            config.get('delay_seconds', 2.5),
+            self.concurrency
+        )
+        self._backoff = wait_exponential_jitter(
+            initial=config.get('retry_delay_seconds', 5),
+            max=30
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
 
-        # Set headers
-        session.headers.update({
-            'User-Agent': self.config.get('user_agent', 'RommelmarktZoeker/1.0'),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'nl-BE,nl;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+    @staticmethod
+    def _is_retryable(exc: BaseException) -> bool:
+        """Retry on network errors and on transient HTTP status codes."""
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code in RETRY_STATUS_CODES
+        return isinstance(exc, httpx.TransportError)
 
-        return session
+    def _wait(self, retry_state: RetryCallState) -> float:
+        """
+        Compute the delay before the next attempt.
 
-    def _respect_rate_limit(self) -> None:
-        """Ensure minimum delay between requests."""
-        delay = self.config.get('delay_seconds', 2.5)
-        elapsed = time.time() - self.last_request_time
+        A rejected response with a Retry-After header (typically 429 or
+        503) is retried after the delay the server asked for, capped at
+        MAX_RETRY_AFTER_SECONDS. Anything else backs off exponentially with
+        jitter.
 
-        if elapsed < delay:
-            sleep_time = delay - elapsed
-            self.logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        Args:
+            retry_state: State of the failed attempt.
 
-    def fetch(self, url: str) -> Optional[str]:
+        Returns:
+            Seconds to sleep.
+        """
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, httpx.HTTPStatusError):
+            delay = _retry_after_seconds(exc.response)
+            if delay is not None:
+                return min(delay, MAX_RETRY_AFTER_SECONDS)
+        return self._backoff(retry_state)
+
+    async def _get(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """
+        Perform a single rate-limited GET request.
+
+        Args:
+            url: The URL to fetch.
+            headers: Extra request headers.
+
+        Returns:
+            The response; 304 Not Modified is passed through.
+
+        Raises:
+            httpx.HTTPStatusError: On any other non-success status.
+        """
+        async with self.limiter:
+            self.logger.info(f"Fetching: {url}")
+            # Stream the body so it is decompressed incrementally as it arrives
+            async with self.client.stream('GET', url, headers=headers) as response:
+                await response.aread()
+
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    async def fetch(self, url: str) -> Optional[str]:
         """
         Fetch URL with rate limiting and error handling.
 
+        Failed attempts are retried after the server's Retry-After delay,
+        or else with jittered exponential backoff. The backoff sleeps
+        outside the limiter, so other requests can use the slot in the
+        meantime.
+
         Args:
             url: The URL to fetch.
 
         Returns:
             HTML content as string, or None if request failed.
         """
-        self._respect_rate_limit()
+        # Revalidate cached responses with a conditional GET
+        cached = self.cache.get(url) if self.cache else None
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.config.get('max_retries', 3) + 1),
+            wait=self._wait,
+            retry=retry_if_exception(self._is_retryable),
+            before_sleep=before_sleep_log(self.logger, logging.WARNING),
+            reraise=True,
+        )
 
         try:
-            self.logger.info(f"Fetching: {url}")
-            timeout = self.config.get('timeout_seconds', 30)
-            response = self.session.get(url, timeout=timeout)
-            self.last_request_time = time.time()
-
-            response.raise_for_status()
-            return response.text
+            async for attempt in retrying:
+                with attempt:
+                    response = await self._get(url, headers)
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             self.logger.error(f"Timeout fetching {url}")
             return None
-        except requests.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             self.logger.error(f"HTTP error fetching {url}: {e.response.status_code}")
             return None
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"Error fetching {url}: {e}")
             return None
 
-    def close(self) -> None:
-        """Close the session."""
-        self.session.close()
+        if response.status_code == 304 and cached:
+            self.logger.debug("Not modified, using cached body: %s", url)
+            return cached.body
+
+        if self.cache:
+            self.cache.store(
+                url,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                response.text
+            )
+        return response.text
+
+    async def close(self) -> None:
+        """Close the response cache, and the HTTP client if not shared."""
+        if self._owns_client:
+            await self.client.aclose()
+        if self.cache:
+            self.cache.close()
@@ -3,46 +3,232 @@
 import re
 from datetime import date
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Match, Optional
 
-from bs4 import BeautifulSoup, Tag
+import httpx
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
 
 from ..models.event import Event
 from .base import BaseScraper
 from .email_decoder import decode_cloudflare_email
-
-
-# Dutch month name mapping
-DUTCH_MONTHS = {
-    'januari': 1, 'jan': 1,
-    'februari': 2, 'feb': 2,
-    'maart': 3, 'mrt': 3, 'mar': 3,
-    'april': 4, 'apr': 4,
-    'mei': 5,
-    'juni': 6, 'jun': 6,
-    'juli': 7, 'jul': 7,
-    'augustus': 8, 'aug': 8,
-    'september': 9, 'sep': 9, 'sept': 9,
-    'oktober': 10, 'okt': 10, 'oct': 10,
-    'november': 11, 'nov': 11,
-    'december': 12, 'dec': 12,
-}
+from .rate_limiter import RateLimiter
+
+
+# Dutch month name spellings, in calendar order
+_MONTH_PATTERNS = (
+    r'jan(?:uari)?',
+    r'feb(?:ruari)?',
+    r'maart|mrt|mart?',
+    r'apr(?:il)?',
+    r'mei',
+    r'jun(?:i)?',
+    r'jul(?:i)?',
+    r'aug(?:ustus)?',
+    r'sep(?:t(?:ember)?)?',
+    r'okt(?:ober)?|oct',
+    r'nov(?:ember)?',
+    r'dec(?:ember)?',
+)
+
+# Regular expressions, compiled once at import time
+
+# URL format: /rommelmarkt/12345/event-name-city
+_URL_SLUG_RE = re.compile(r'/rommelmarkt/\d+/(.+?)(?:\?|$)')
+_TRAILING_POSTCODE_RE = re.compile(r'\s+\d{4}\s*$')
+
+# Belgian postcode followed by city: "9140 TEMSE" or "9140 Temse"
+_POSTCODE_RE = re.compile(r'(\d{4})\s+([A-Z][A-Za-z\-]+(?:\s*-\s*[A-Za-z]+)?)')
+
+# Street name + number, e.g., "Kapelanielaan 27", "Grote Markt 1"
+_STREET_SUFFIXES = (
+    'straat', 'laan', 'plein', 'weg', 'baan', 'dreef', 'steenweg', 'lei', 'kaai', 'ring',
+    'boulevard', 'dijk', 'gracht', 'singel', 'pad', 'hof', 'park', 'wijk', 'veld', 'markt'
+)
+_ADDRESS_RE = re.compile(
+    r'\b([A-Z][a-z]+(?:[a-z]*)(?:' + '|'.join(_STREET_SUFFIXES) + r'))\s+(\d+[A-Za-z]?)\b',
+    re.IGNORECASE
+)
+_MULTIWORD_ADDRESS_RE = re.compile(
+    r'\b([A-Z][a-z]+\s+(?:[A-Z]?[a-z]+\s+)*(?:' + '|'.join(_STREET_SUFFIXES) + r'))'
+    r'\s+(\d+[A-Za-z]?)\b',
+    re.IGNORECASE
+)
+
+# "GEMEENTE (POSTCODE) Adres"
+_LOCATION_TEXT_RE = re.compile(r'^([A-Z][A-Za-z\s\-]+?)\s*\((\d{4})\)\s*(.+)?$')
+
+# Day names mark date headers; section names mark non-title headers
+_DAY_RE = re.compile(
+    r'maandag|dinsdag|woensdag|donderdag|vrijdag|zaterdag|zondag',
+    re.IGNORECASE
+)
+_SECTION_HEADER_RE = re.compile(r'thema|waar|contact|wanneer|info|prijs', re.IGNORECASE)
+
+# "za 7 feb 2026" or "zaterdag 7 februari 2026". Group 1 is the day and
+# groups 2-13 are the months, so the month number is lastindex - 1. The
+# year is only checked by the lookahead and read right after the match.
+_DATE_RE = re.compile(
+    r'(?:ma|di|wo|do|vr|za|zo|maandag|dinsdag|woensdag|donderdag|vrijdag|zaterdag|zondag)\s+'
+    r'(\d{1,2})\s+'
+    r'(?:' + '|'.join(f'({pattern})' for pattern in _MONTH_PATTERNS) + r')\s+'
+    r'(?=\d{4})',
+    re.IGNORECASE
+)
+
+# "9:00 - 17:30" or "09:00 tot 17:30"
+_TIME_RE = re.compile(r'(\d{1,2}[:.]\d{2})\s*[-–tot]+\s*(\d{1,2}[:.]\d{2})')
+
+# Known event type keywords, matched against lowercased badge text
+_KNOWN_TYPES = frozenset([
+    'rommelmarkt', 'binnenrommelmarkt', 'buitenrommelmarkt',
+    'antiekbeurs', 'brocante beurs', 'brocantebeurs',
+    'kinderrommelmarkt', 'tweedehandsmarkt', 'vlooienmarkt',
+    'verzamelbeurs', 'curiosamarkt', 'garageverkoop'
+])
+_KNOWN_TYPES_RE = re.compile('|'.join(map(re.escape, sorted(_KNOWN_TYPES))))
+
+# "Inkom 4,50 €" or "Standplaats: 9 EUR"
+_INKOM_PRICE_RE = re.compile(
+    r'(?:inkom|toegang|entree|entrance)[:\s]*\**(\d+(?:[,.]\d+)?)\s*(?:€|EUR|euro)?',
+    re.IGNORECASE
+)
+_STANDPLAATS_PRICE_RE = re.compile(
+    r'(?:standplaats|stand|tafel|kraam)[:\s]*\**(\d+(?:[,.]\d+)?)\s*(?:€|EUR|euro)?',
+    re.IGNORECASE
+)
+
+_ORGANISATOR_RES = [
+    re.compile(r'(?:organisator|georganiseerd door)[:\s]*([^\n,]+)', re.IGNORECASE),
+    re.compile(r'(?:org\.?)[:\s]*([^\n,]+)', re.IGNORECASE),
+]
+_ORGANISATOR_SUFFIX_RE = re.compile(r'\s*(tel|email|www|http).*$', re.IGNORECASE)
+
+# Belgian phone patterns
+_PHONE_RES = [
+    re.compile(r'(?:tel(?:efoon)?|gsm|phone)[.:\s]*(\+?32[\s./\-]?(?:\d[\s./\-]?){8,})', re.IGNORECASE),
+    re.compile(r'(?:tel(?:efoon)?|gsm|phone)[.:\s]*(0\d[\s./\-]?(?:\d[\s./\-]?){7,})', re.IGNORECASE),
+    re.compile(r'(\+32[\s./\-]?\d[\s./\-]?(?:\d[\s./\-]?){7,})'),
+    re.compile(r'(0\d{1,3}[\s./\-]?\d{2}[\s./\-]?\d{2}[\s./\-]?\d{2})'),
+]
+# Phone number separators; whitespace runs are collapsed by split()
+_PHONE_TRANS = str.maketrans('./-', '   ')
+
+_CF_HASH_RE = re.compile(r'#([a-f0-9]+)$', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+_WEBSITE_RE = re.compile(
+    r'(?:website|www|http)[:\s]*(https?://[^\s<>"]+|www\.[^\s<>"]+)',
+    re.IGNORECASE
+)
+
+# Paragraphs that are page boilerplate rather than event description
+_DESC_SKIP_RE = re.compile(r'cookie|privacy|copyright|advertentie', re.IGNORECASE)
+
+# Page text fields with their patterns, in priority order per field
+_TEXT_FIELD_PATTERNS = (
+    ('datum', _DATE_RE),
+    ('tijden', _TIME_RE),
+    ('inkom_prijs', _INKOM_PRICE_RE),
+    ('standplaats_prijs', _STANDPLAATS_PRICE_RE),
+    *(('organisator', pattern) for pattern in _ORGANISATOR_RES),
+    *(('telefoon', pattern) for pattern in _PHONE_RES),
+    ('email', _EMAIL_RE),
+    ('website', _WEBSITE_RE),
+)
+
+
+@lru_cache(maxsize=2048)
+def _normalize_gemeente(name: str) -> str:
+    """Normalize a municipality name to title case."""
+    return name.strip().title()
+
+
+@lru_cache(maxsize=256)
+def _to_decimal(value: str) -> Decimal:
+    """Parse a price string; prices repeat a lot across events."""
+    return Decimal(value)
+
+
+@lru_cache(maxsize=2048)
+def _clean_organisator(name: str) -> str:
+    """Strip trailing contact details from an organizer name."""
+    return _ORGANISATOR_SUFFIX_RE.sub('', name.strip())
+
+
+def _stripped_text(element: HtmlElement) -> str:
+    """Concatenate the stripped text fragments of an element."""
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def _page_text(tree: HtmlElement) -> str:
+    """
+    Get the visible text of a page, one stripped text fragment per line.
+
+    Fragments are separated by newlines rather than glued together, so
+    text from adjacent elements can't merge into a single token, while
+    line-based patterns (e.g., the organizer name) still see line ends.
+    """
+    return '\n'.join(filter(None, (part.strip() for part in tree.itertext())))
 
 
 class DetailScraper(BaseScraper):
     """Scraper for individual event detail pages."""
 
-    def __init__(self, config: Dict[str, Any]):
+    # Comments and processing instructions are dropped while parsing
+    HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+
+    # Subtrees that never hold event data
+    SKIPPED_TAGS = ('script', 'style', 'svg', 'template')
+
+    # Selectors, compiled once and reused for every page
+    TITLE_XPATH = etree.XPath('(//title)[1]')
+    H3_XPATH = etree.XPath('//h3')
+    H4_XPATH = etree.XPath('//h4')
+    PARAGRAPH_XPATH = etree.XPath('//p')
+    BADGE_XPATH = etree.XPath(
+        "//*[self::span or self::a or self::div]"
+        "[re:test(@class, 'badge|btn|theme|tag|label|category', 'i')]",
+        namespaces={'re': 'http://exslt.org/regular-expressions'}
+    )
+    # Cloudflare-protected emails: link hrefs and data-cfemail attributes
+    CF_EMAIL_XPATH = etree.XPath(
+        "//a[contains(@href, '/cdn-cgi/l/email-protection')]/@href"
+        " | //*[@data-cfemail]/@data-cfemail"
+    )
+    # First external link; internal links are skipped
+    EXTERNAL_LINK_XPATH = etree.XPath(
+        "(//a[starts-with(@href, 'http') and not(contains(@href, 'rommelmarkten.be'))]/@href)[1]"
+    )
+    # First poster-like image, and first content image as fallback
+    POSTER_IMG_XPATH = etree.XPath(
+        "(//img[re:test(@src, 'affiche|poster|flyer|banner', 'i')]/@src)[1]",
+        namespaces={'re': 'http://exslt.org/regular-expressions'}
+    )
+    CONTENT_IMG_XPATH = etree.XPath(
+        "(//img[re:test(@src, '/content/', 'i')]/@src)[1]",
+        namespaces={'re': 'http://exslt.org/regular-expressions'}
+    )
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        limiter: Optional[RateLimiter] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the detail scraper.
 
         Args:
             config: Scraping configuration dictionary.
+            limiter: Optional rate limiter shared with other scrapers.
+            client: Optional HTTP client shared with other scrapers.
         """
-        super().__init__(config)
+        super().__init__(config, limiter, client)
         self.base_url = config.get('base_url', 'https://www.rommelmarkten.be')
 
-    def scrape_detail_page(self, url: str, event_id: int) -> Optional[Event]:
+    async def scrape_detail_page(self, url: str, event_id: int) -> Optional[Event]:
         """
         Scrape an event detail page and extract all information.
 
@@ -53,20 +239,45 @@ class DetailScraper(BaseScraper):
         Returns:
             Event object with extracted data, or None if scraping failed.
         """
-        html = self.fetch(url)
+        html = await self.fetch(url)
 
         if not html:
             self.logger.warning(f"Failed to fetch detail page: {url}")
             return None
 
-        soup = BeautifulSoup(html, 'lxml')
+        return self.parse_detail_page(html, url, event_id)
+
+    def parse_detail_page(self, html: str, url: str, event_id: int) -> Optional[Event]:
+        """
+        Extract all event information from a detail page's HTML.
+
+        Args:
+            html: HTML content of the detail page.
+            url: Full URL of the detail page.
+            event_id: The event ID from the URL.
 
+        Returns:
+            Event object with extracted data, or None if parsing failed.
+        """
         try:
+            tree = lxml.html.document_fromstring(html, parser=self.HTML_PARSER)
+            # Drop subtrees without event data before any selector or text walk
+            etree.strip_elements(tree, *self.SKIPPED_TAGS, with_tail=False)
+
+            # Walk the tree for its text once and share it between extractors
+            raw_text = _page_text(tree)
+            norm_text = ' '.join(raw_text.split())
+
             # Extract location info (gemeente, postcode, adres)
-            location_info = self._extract_location_info(soup)
+            location_info = self._extract_location_info(norm_text)
+
+            # Match all text-based fields; start and end time come from a
+            # single match
+            fields = self._scan_text_fields(raw_text)
+            times = self._extract_times(fields.get('tijden', []))
 
             # Extract title, with URL slug as fallback
-            naam = self._extract_title(soup)
+            naam = self._extract_title(tree)
             if naam == "Onbekend":
                 # Try to extract from URL slug
                 naam = self._title_from_url(url)
@@ -77,23 +288,23 @@ class DetailScraper(BaseScraper):
                 gemeente=location_info.get('gemeente'),
                 postcode=location_info.get('postcode'),
                 adres=location_info.get('adres'),
-                locatie_naam=self._extract_locatie_naam(soup),
-                datum=self._extract_datum(soup),
-                start_tijd=self._extract_start_tijd(soup),
-                eind_tijd=self._extract_eind_tijd(soup),
-                types=self._extract_types(soup),
-                inkom_prijs=self._extract_inkom_prijs(soup),
-                standplaats_prijs=self._extract_standplaats_prijs(soup),
-                organisator=self._extract_organisator(soup),
-                telefoon=self._extract_telefoon(soup),
-                email=self._extract_email(soup),
-                website=self._extract_website(soup),
-                beschrijving=self._extract_beschrijving(soup),
-                afbeelding_url=self._extract_afbeelding(soup),
+                locatie_naam=self._extract_locatie_naam(tree),
+                datum=self._extract_datum(fields.get('datum', [])),
+                start_tijd=times[0] if times else None,
+                eind_tijd=times[1] if len(times) > 1 else None,
+                types=self._extract_types(tree),
+                inkom_prijs=self._extract_price(fields.get('inkom_prijs', [])),
+                standplaats_prijs=self._extract_price(fields.get('standplaats_prijs', [])),
+                organisator=self._extract_organisator(fields.get('organisator', [])),
+                telefoon=self._extract_telefoon(fields.get('telefoon', [])),
+                email=self._extract_email(tree, fields.get('email', [])),
+                website=self._extract_website(tree, fields.get('website', [])),
+                beschrijving=self._extract_beschrijving(tree),
+                afbeelding_url=self._extract_afbeelding(tree),
                 source_url=url
             )
 
-            self.logger.debug(f"Extracted event: {event.naam}")
+            self.logger.debug("Extracted event: %s", event.naam)
             return event
 
         except Exception as e:
@@ -102,35 +313,32 @@ class DetailScraper(BaseScraper):
 
     def _title_from_url(self, url: str) -> str:
         """Extract a title from the URL slug."""
-        # URL format: /rommelmarkt/12345/event-name-city
-        match = re.search(r'/rommelmarkt/\d+/(.+?)(?:\?|$)', url)
+        match = _URL_SLUG_RE.search(url)
         if match:
             slug = match.group(1)
             # Convert slug to title: replace hyphens with spaces, title case
             title = slug.replace('-', ' ').strip()
             # Clean up common suffixes like city names
-            title = re.sub(r'\s+\d{4}\s*$', '', title)  # Remove postcodes
+            title = _TRAILING_POSTCODE_RE.sub('', title)  # Remove postcodes
             return title.title()
         return "Onbekend"
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree: HtmlElement) -> str:
         """Extract event title from page."""
         # First try: Look in the <title> tag which usually has the event name
-        title_tag = soup.find('title')
-        if title_tag:
-            text = title_tag.get_text(strip=True)
+        for title_tag in self.TITLE_XPATH(tree):
+            text = _stripped_text(title_tag)
             # Format is typically: "Event Name | rommelmarkten.be"
             if ' | ' in text:
                 return text.split(' | ')[0].strip()
 
         # Second try: Look for h3 that doesn't contain section headers
-        section_headers = ['thema', 'waar', 'contact', 'wanneer', 'info', 'prijs']
-        for h3 in soup.find_all('h3'):
-            text = h3.get_text(strip=True)
+        for h3 in self.H3_XPATH(tree):
+            text = _stripped_text(h3)
             # Skip if it looks like a section header
-            if text and not any(header in text.lower() for header in section_headers):
+            if text and not _SECTION_HEADER_RE.search(text):
                 # Skip if it contains an image (usually location markers)
-                if not h3.find('img'):
+                if h3.find('.//img') is None:
                     return text
 
         # Third try: Extract from URL slug if available
@@ -138,7 +346,7 @@ class DetailScraper(BaseScraper):
 
         return "Onbekend"
 
-    def _extract_location_info(self, soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+    def _extract_location_info(self, text: str) -> Dict[str, Optional[str]]:
         """
         Extract gemeente, postcode, and adres from location text.
 
@@ -146,43 +354,30 @@ class DetailScraper(BaseScraper):
         Format is typically:
         - Address line (e.g., "Kapelanielaan 27")
         - Postcode + City (e.g., "9140 TEMSE")
+
+        Args:
+            text: Page text with whitespace collapsed to single spaces.
         """
         result = {'gemeente': None, 'postcode': None, 'adres': None}
 
-        # Get text and normalize whitespace (replace multiple spaces/newlines with single space)
-        raw_text = soup.get_text()
-        text = ' '.join(raw_text.split())
-
         # Pattern 1: Look for Belgian postcode followed by city
-        # Format: "9140 TEMSE" or "9140 Temse"
-        postcode_pattern = re.compile(
-            r'(\d{4})\s+([A-Z][A-Za-z\-]+(?:\s*-\s*[A-Za-z]+)?)',
-        )
-        match = postcode_pattern.search(text)
+        match = _POSTCODE_RE.search(text)
         if match:
             result['postcode'] = match.group(1)
-            result['gemeente'] = match.group(2).strip().title()
-
-        # Pattern 2: Look for street address with common Belgian street suffixes
-        # Street name + number, e.g., "Kapelanielaan 27", "Grote Markt 1"
-        street_suffixes = (
-            'straat|laan|plein|weg|baan|dreef|steenweg|lei|kaai|ring|'
-            'boulevard|dijk|gracht|singel|pad|hof|park|wijk|veld|markt'
-        )
-        address_pattern = re.compile(
-            rf'\b([A-Z][a-z]+(?:[a-z]*)(?:{street_suffixes}))\s+(\d+[A-Za-z]?)\b',
-            re.IGNORECASE
-        )
-        match = address_pattern.search(text)
+            result['gemeente'] = _normalize_gemeente(match.group(2))
+
+        # Pattern 2: Look for street address with common Belgian street suffixes,
+        # but only if a suffix occurs in the text at all
+        lowered = text.lower()
+        if not any(suffix in lowered for suffix in _STREET_SUFFIXES):
+            return result
+
+        match = _ADDRESS_RE.search(text)
         if match:
             result['adres'] = match.group(0).strip()
         else:
             # Fallback: look for multi-word street names like "Grote Markt 1"
-            multiword_pattern = re.compile(
-                rf'\b([A-Z][a-z]+\s+(?:[A-Z]?[a-z]+\s+)*(?:{street_suffixes}))\s+(\d+[A-Za-z]?)\b',
-                re.IGNORECASE
-            )
-            match = multiword_pattern.search(text)
+            match = _MULTIWORD_ADDRESS_RE.search(text)
             if match:
                 result['adres'] = match.group(0).strip()
 
@@ -193,245 +388,149 @@ class DetailScraper(BaseScraper):
         result = {'gemeente': None, 'postcode': None, 'adres': None}
 
         # Pattern: GEMEENTE (POSTCODE) Adres
-        match = re.match(
-            r'^([A-Z][A-Za-z\s\-]+?)\s*\((\d{4})\)\s*(.+)?$',
-            text.strip()
-        )
+        match = _LOCATION_TEXT_RE.match(text.strip())
         if match:
-            result['gemeente'] = match.group(1).strip().title()
+            result['gemeente'] = _normalize_gemeente(match.group(1))
             result['postcode'] = match.group(2)
             if match.group(3):
                 result['adres'] = match.group(3).strip()
 
         return result
 
-    def _extract_locatie_naam(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_locatie_naam(self, tree: HtmlElement) -> Optional[str]:
         """Extract venue/location name (h4 element)."""
         # Venue name is often in h4 before the main title
-        h4_elements = soup.find_all('h4')
-        for h4 in h4_elements:
-            text = h4.get_text(strip=True)
+        for h4 in self.H4_XPATH(tree):
+            text = _stripped_text(h4)
             # Skip date headers (contain day names)
-            if not any(day in text.lower() for day in
-                      ['maandag', 'dinsdag', 'woensdag', 'donderdag',
-                       'vrijdag', 'zaterdag', 'zondag']):
+            if not _DAY_RE.search(text):
                 return text
         return None
 
-    def _extract_datum(self, soup: BeautifulSoup) -> Optional[date]:
-        """Extract event date from page."""
-        # Look for date patterns in the page text
-        text = soup.get_text()
-
-        # Pattern: "za 7 feb 2026" or "zaterdag 7 februari 2026"
-        date_pattern = re.compile(
-            r'(?:ma|di|wo|do|vr|za|zo|maandag|dinsdag|woensdag|donderdag|vrijdag|zaterdag|zondag)\s+'
-            r'(\d{1,2})\s+'
-            r'(jan(?:uari)?|feb(?:ruari)?|mrt|mar(?:t)?|apr(?:il)?|mei|jun(?:i)?|jul(?:i)?|'
-            r'aug(?:ustus)?|sep(?:t(?:ember)?)?|okt(?:ober)?|oct|nov(?:ember)?|dec(?:ember)?)\s+'
-            r'(\d{4})',
-            re.IGNORECASE
-        )
-
-        match = date_pattern.search(text)
-        if match:
-            day = int(match.group(1))
-            month_str = match.group(2).lower()
-            year = int(match.group(3))
+    def _scan_text_fields(self, text: str) -> Dict[str, List[Match[str]]]:
+        """
+        Find the first match of every text field pattern.
 
-            month = DUTCH_MONTHS.get(month_str)
-            if month:
-                try:
-                    return date(year, month, day)
-                except ValueError:
-                    pass
+        Each pattern searches the whole text on its own, so a match for one
+        field never hides text that another field needs.
 
-        return None
+        Args:
+            text: Page text.
 
-    def _extract_start_tijd(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract start time from page."""
-        times = self._extract_times(soup)
-        return times[0] if times else None
+        Returns:
+            Mapping of field name to the matches of its own patterns, in
+            priority order. Fields without any match are left out.
+        """
+        fields: Dict[str, List[Match[str]]] = {}
+        for field, pattern in _TEXT_FIELD_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                fields.setdefault(field, []).append(match)
+        return fields
 
-    def _extract_eind_tijd(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract end time from page."""
-        times = self._extract_times(soup)
-        return times[1] if len(times) > 1 else None
+    def _extract_datum(self, matches: List[Match[str]]) -> Optional[date]:
+        """Extract event date from its text match."""
+        for match in matches:
+            day = int(match.group(1))
+            month = match.lastindex - 1
+            year = int(match.string[match.end():match.end() + 4])
 
-    def _extract_times(self, soup: BeautifulSoup) -> List[str]:
-        """Extract start and end times from page."""
-        text = soup.get_text()
+            try:
+                return date(year, month, day)
+            except ValueError:
+                pass
 
-        # Pattern: "9:00 - 17:30" or "09:00 tot 17:30"
-        time_pattern = re.compile(
-            r'(\d{1,2}[:.]\d{2})\s*[-–tot]+\s*(\d{1,2}[:.]\d{2})'
-        )
+        return None
 
-        match = time_pattern.search(text)
-        if match:
+    def _extract_times(self, matches: List[Match[str]]) -> List[str]:
+        """Extract start and end times from their text match."""
+        for match in matches:
             start = match.group(1).replace('.', ':')
             end = match.group(2).replace('.', ':')
             return [start, end]
 
         return []
 
-    def _extract_types(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_types(self, tree: HtmlElement) -> List[str]:
         """Extract event types (badges/tags)."""
         types = []
 
-        # Known event type keywords
-        known_types = [
-            'rommelmarkt', 'binnenrommelmarkt', 'buitenrommelmarkt',
-            'antiekbeurs', 'brocante beurs', 'brocantebeurs',
-            'kinderrommelmarkt', 'tweedehandsmarkt', 'vlooienmarkt',
-            'verzamelbeurs', 'curiosamarkt', 'garageverkoop'
-        ]
-
         # Look for badge-style elements
-        for element in soup.find_all(['span', 'a', 'div'], class_=re.compile(
-            r'badge|btn|theme|tag|label|category', re.I
-        )):
-            text = element.get_text(strip=True).lower()
-            if text in known_types or any(kt in text for kt in known_types):
+        for element in self.BADGE_XPATH(tree):
+            text = _stripped_text(element).lower()
+            if text in _KNOWN_TYPES or _KNOWN_TYPES_RE.search(text):
                 types.append(text.title())
 
         # Deduplicate while preserving order
-        seen = set()
-        unique_types = []
-        for t in types:
-            if t.lower() not in seen:
-                seen.add(t.lower())
-                unique_types.append(t)
-
-        return unique_types
+        return list(dict.fromkeys(types))
 
-    def _extract_inkom_prijs(self, soup: BeautifulSoup) -> Optional[Decimal]:
-        """Extract entrance price."""
-        return self._extract_price(soup, ['inkom', 'toegang', 'entree', 'entrance'])
-
-    def _extract_standplaats_prijs(self, soup: BeautifulSoup) -> Optional[Decimal]:
-        """Extract booth/stand price."""
-        return self._extract_price(soup, ['standplaats', 'stand', 'tafel', 'kraam'])
-
-    def _extract_price(self, soup: BeautifulSoup, keywords: List[str]) -> Optional[Decimal]:
+    def _extract_price(self, matches: List[Match[str]]) -> Optional[Decimal]:
         """
         Extract a price value based on nearby keywords.
 
         Args:
-            soup: BeautifulSoup object.
-            keywords: List of keywords that indicate this price type.
+            matches: Text matches of the price type's keyword pattern.
 
         Returns:
             Price as Decimal, or None if not found.
         """
-        text = soup.get_text()
-
-        for keyword in keywords:
-            # Pattern: "Inkom 4,50 €" or "Standplaats: 9 EUR" etc.
-            pattern = re.compile(
-                rf'{keyword}[:\s]*\**(\d+(?:[,\.]\d+)?)\s*(?:€|EUR|euro)?\**',
-                re.IGNORECASE
-            )
-            match = pattern.search(text)
-            if match:
-                price_str = match.group(1).replace(',', '.')
-                try:
-                    return Decimal(price_str)
-                except InvalidOperation:
-                    continue
+        for match in matches:
+            price_str = match.group(1).replace(',', '.')
+            try:
+                return _to_decimal(price_str)
+            except InvalidOperation:
+                pass
 
         return None
 
-    def _extract_organisator(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_organisator(self, matches: List[Match[str]]) -> Optional[str]:
         """Extract organizer name."""
-        # Look for text after "Organisator:" or in strong/bold tags
-        text = soup.get_text()
-
-        patterns = [
-            r'(?:organisator|georganiseerd door)[:\s]*([^\n,]+)',
-            r'(?:org\.?)[:\s]*([^\n,]+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                org = match.group(1).strip()
-                # Clean up common suffixes
-                org = re.sub(r'\s*(tel|email|www|http).*$', '', org, flags=re.I)
-                if org and len(org) > 2:
-                    return org
+        # Text after "Organisator:" or "Org."
+        for match in matches:
+            # Clean up common suffixes
+            org = _clean_organisator(match.group(1))
+            if org and len(org) > 2:
+                return org
 
         return None
 
-    def _extract_telefoon(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_telefoon(self, matches: List[Match[str]]) -> Optional[str]:
         """Extract phone number."""
-        text = soup.get_text()
-
-        # Belgian phone patterns
-        patterns = [
-            r'(?:tel(?:efoon)?|gsm|phone)[.:\s]*(\+?32[\s./\-]?(?:\d[\s./\-]?){8,})',
-            r'(?:tel(?:efoon)?|gsm|phone)[.:\s]*(0\d[\s./\-]?(?:\d[\s./\-]?){7,})',
-            r'(\+32[\s./\-]?\d[\s./\-]?(?:\d[\s./\-]?){7,})',
-            r'(0\d{1,3}[\s./\-]?\d{2}[\s./\-]?\d{2}[\s./\-]?\d{2})',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                phone = match.group(1).strip()
-                # Normalize
-                phone = re.sub(r'[\s./\-]+', ' ', phone)
-                return phone
+        for match in matches:
+            # Normalize separators to single spaces
+            return ' '.join(match.group(1).translate(_PHONE_TRANS).split())
 
         return None
 
-    def _extract_email(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_email(self, tree: HtmlElement, matches: List[Match[str]]) -> Optional[str]:
         """Extract and decode email address."""
-        # Look for Cloudflare-protected email
-        cf_link = soup.find('a', href=re.compile(r'/cdn-cgi/l/email-protection'))
-        if cf_link:
-            href = cf_link.get('href', '')
-            match = re.search(r'#([a-f0-9]+)$', href, re.I)
-            if match:
-                decoded = decode_cloudflare_email(match.group(1))
-                if decoded and '@' in decoded:
-                    return decoded
-
-        # Look for data-cfemail attribute
-        cf_span = soup.find(attrs={'data-cfemail': True})
-        if cf_span:
-            encoded = cf_span.get('data-cfemail', '')
+        # Look for Cloudflare-protected email, either in a link's hash or
+        # in a data-cfemail attribute
+        for encoded in self.CF_EMAIL_XPATH(tree):
+            if 'email-protection' in encoded:
+                match = _CF_HASH_RE.search(encoded)
+                if not match:
+                    continue
+                encoded = match.group(1)
             decoded = decode_cloudflare_email(encoded)
             if decoded and '@' in decoded:
                 return decoded
 
-        # Look for regular email pattern
-        text = soup.get_text()
-        email_pattern = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
-        match = email_pattern.search(text)
-        if match:
+        # Fall back to a regular email address in the text
+        for match in matches:
             return match.group(0)
 
         return None
 
-    def _extract_website(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_website(self, tree: HtmlElement, matches: List[Match[str]]) -> Optional[str]:
         """Extract website URL."""
         # Look for external links
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            # Skip internal links and email links
-            if href.startswith('http') and 'rommelmarkten.be' not in href:
-                if not href.startswith('mailto:'):
-                    return href
+        hrefs = self.EXTERNAL_LINK_XPATH(tree)
+        if hrefs:
+            return hrefs[0]
 
         # Look for URL in text
-        text = soup.get_text()
-        url_pattern = re.compile(
-            r'(?:website|www|http)[:\s]*(https?://[^\s<>"]+|www\.[^\s<>"]+)',
-            re.IGNORECASE
-        )
-        match = url_pattern.search(text)
-        if match:
+        for match in matches:
             url = match.group(1)
             if not url.startswith('http'):
                 url = 'http://' + url
@@ -439,41 +538,32 @@ class DetailScraper(BaseScraper):
 
         return None
 
-    def _extract_beschrijving(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_beschrijving(self, tree: HtmlElement) -> Optional[str]:
         """Extract event description."""
         # Look for description in paragraph tags
-        paragraphs = soup.find_all('p')
-
         descriptions = []
-        for p in paragraphs:
-            text = p.get_text(strip=True)
+        for p in self.PARAGRAPH_XPATH(tree):
+            text = _stripped_text(p)
             # Skip very short or irrelevant text
-            if len(text) > 50 and not any(skip in text.lower() for skip in
-                ['cookie', 'privacy', 'copyright', 'advertentie']):
+            if len(text) > 50 and not _DESC_SKIP_RE.search(text):
                 descriptions.append(text)
+                # Limit to first 3 paragraphs
+                if len(descriptions) == 3:
+                    break
 
         if descriptions:
-            return '\n\n'.join(descriptions[:3])  # Limit to first 3 paragraphs
+            return '\n\n'.join(descriptions)
 
         return None
 
-    def _extract_afbeelding(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_afbeelding(self, tree: HtmlElement) -> Optional[str]:
         """Extract event poster/image URL."""
-        # Look for images in content area
-        for img in soup.find_all('img', src=True):
-            src = img.get('src', '')
-            # Look for poster/affiche images
-            if any(indicator in src.lower() for indicator in
-                   ['affiche', 'poster', 'flyer', 'banner']):
-                if src.startswith('/'):
-                    return f"{self.base_url}{src}"
-                return src
-
-        # Look for content images
-        for img in soup.find_all('img', src=re.compile(r'/content/', re.I)):
-            src = img.get('src', '')
-            if src.startswith('/'):
-                return f"{self.base_url}{src}"
-            return src
+        # Prefer poster/affiche images, then any image from the content area
+        sources = self.POSTER_IMG_XPATH(tree) or self.CONTENT_IMG_XPATH(tree)
+        if not sources:
+            return None
 
-        return None
+        src = sources[0]
+        if src.startswith('/'):
+            return f"{self.base_url}{src}"
+        return src
@@ -1,8 +1,15 @@
 """Decoder for Cloudflare email protection obfuscation."""
 
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=256)
+def _xor_table(key: int) -> bytes:
+    """Build a bytes.translate() table that XORs every byte with key."""
+    return bytes(b ^ key for b in range(256))
+
+
 def decode_cloudflare_email(encoded_string: str) -> Optional[str]:
     """
     Decode Cloudflare's email protection encoding.
@@ -26,17 +33,9 @@ def decode_cloudflare_email(encoded_string: str) -> Optional[str]:
         return None
 
     try:
-        # First byte is the XOR key
-        key = int(encoded_string[:2], 16)
-
-        # Decode remaining bytes by XORing with the key
-        decoded_chars = []
-        for i in range(2, len(encoded_string), 2):
-            hex_pair = encoded_string[i:i + 2]
-            char_code = int(hex_pair, 16) ^ key
-            decoded_chars.append(chr(char_code))
-
-        return ''.join(decoded_chars)
+        raw = bytes.fromhex(encoded_string)
+        # First byte is the XOR key, the rest is the XORed email address
+        return raw[1:].translate(_xor_table(raw[0])).decode('latin-1')
 
     except (ValueError, IndexError):
         return None
@@ -0,0 +1,101 @@
+"""SQLite-backed HTTP response cache for conditional GET requests."""
+
+import logging
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: str
+
+
+class HttpCache:
+    """Stores response bodies with ETag/Last-Modified validators per URL."""
+
+    def __init__(self, db_path: str):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            db_path: Path to the SQLite cache file.
+        """
+        self.db_path = Path(db_path)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_mod TEXT,
+                body BLOB
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            url: The requested URL.
+
+        Returns:
+            CachedResponse, or None if the URL is not cached.
+        """
+        row = self.conn.execute(
+            "SELECT etag, last_mod, body FROM http_cache WHERE url = ?",
+            (url,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            body = zlib.decompress(row[2]).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError):
+            self.logger.warning(f"Discarding corrupt cache entry for {url}")
+            return None
+
+        return CachedResponse(etag=row[0], last_modified=row[1], body=body)
+
+    def store(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: str
+    ) -> None:
+        """
+        Store a response body and its validators.
+
+        Responses without an ETag or Last-Modified header can't be
+        revalidated, so they are not stored.
+
+        Args:
+            url: The requested URL.
+            etag: Value of the ETag response header.
+            last_modified: Value of the Last-Modified response header.
+            body: Decoded response body.
+        """
+        if not etag and not last_modified:
+            return
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO http_cache (url, etag, last_mod, body) "
+            "VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, zlib.compress(body.encode('utf-8')))
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self.conn.close()
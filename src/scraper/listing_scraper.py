@@ -2,11 +2,14 @@
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+from lxml import etree
 
 from .base import BaseScraper
+from .rate_limiter import RateLimiter
 
 
 @dataclass
@@ -20,20 +23,56 @@ class EventLink:
 class ListingScraper(BaseScraper):
     """Scraper for province/month listing pages."""
 
-    # Pattern to match event detail URLs
-    EVENT_LINK_PATTERN = re.compile(r'/rommelmarkt/(\d+)/(.+)')
-
-    def __init__(self, config: Dict[str, Any]):
+    # Listing pages are fetched on every run, so they are revalidated with
+    # conditional GETs. Detail pages of known events are skipped instead.
+    USE_HTTP_CACHE = True
+
+    # Pattern to extract the event ID and slug from site-relative detail URLs
+    EVENT_LINK_PATTERN = re.compile(r'/rommelmarkt/(\d+)/([^?#]+)')
+
+    # Selector for event detail link targets, compiled once; the href
+    # filter runs inside libxml2 via the EXSLT regular expressions extension.
+    # Only relative links and absolute links on $base_url are accepted, so
+    # off-site links that merely contain a detail path (e.g., share links)
+    # are skipped.
+    EVENT_LINK_XPATH = etree.XPath(
+        r"//a[re:test(@href, '^/rommelmarkt/\d+/')"
+        r" or (starts-with(@href, $base_url)"
+        r" and re:test(substring-after(@href, $base_url), '^/rommelmarkt/\d+/'))]/@href",
+        namespaces={'re': 'http://exslt.org/regular-expressions'}
+    )
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        limiter: Optional[RateLimiter] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the listing scraper.
 
         Args:
             config: Scraping configuration dictionary.
+            limiter: Optional rate limiter shared with other scrapers.
+            client: Optional HTTP client shared with other scrapers.
         """
-        super().__init__(config)
+        super().__init__(config, limiter, client)
         self.base_url = config.get('base_url', 'https://www.rommelmarkten.be')
 
-    def scrape_listing_page(self, province: str, month: str) -> List[EventLink]:
+        # Listing URLs are "<prefix><month><suffix>"; see prepare()
+        self._url_prefix = f"{self.base_url}/rommelmarkten-tijdens-"
+        self._url_suffix: Dict[str, str] = {}
+
+    def prepare(self, provinces: List[str]) -> None:
+        """
+        Precompute the province part of the listing URLs for a run.
+
+        Args:
+            provinces: Province names that will be scraped.
+        """
+        self._url_suffix = {province: f"-in-{province}" for province in provinces}
+
+    async def scrape_listing_page(self, province: str, month: str) -> List[EventLink]:
         """
         Scrape a listing page and extract all event links.
 
@@ -44,45 +83,44 @@ class ListingScraper(BaseScraper):
         Returns:
             List of EventLink objects with event IDs, slugs, and URLs.
         """
-        url = f"{self.base_url}/rommelmarkten-tijdens-{month}-in-{province}"
-        html = self.fetch(url)
+        suffix = self._url_suffix.get(province) or f"-in-{province}"
+        url = self._url_prefix + month + suffix
+        html = await self.fetch(url)
 
         if not html:
             self.logger.warning(f"Failed to fetch listing page: {url}")
             return []
 
-        soup = BeautifulSoup(html, 'lxml')
-        event_links = []
-
-        # Find all links matching the event detail pattern
-        for link in soup.find_all('a', href=self.EVENT_LINK_PATTERN):
-            href = link.get('href')
-            match = self.EVENT_LINK_PATTERN.match(href)
-
-            if match:
-                event_id = int(match.group(1))
-                slug = match.group(2)
-
-                # Build full URL if href is relative
-                if href.startswith('/'):
-                    full_url = f"{self.base_url}{href}"
-                else:
-                    full_url = href
-
-                event_links.append(EventLink(
-                    id=event_id,
-                    slug=slug,
-                    url=full_url
-                ))
-
-        # Deduplicate (same event may appear multiple times on the page)
-        seen_ids = set()
-        unique_links = []
-        for link in event_links:
-            if link.id not in seen_ids:
-                seen_ids.add(link.id)
-                unique_links.append(link)
+        # An empty body or one with an XML encoding declaration can't be parsed
+        try:
+            tree = lxml.html.document_fromstring(html)
+        except (etree.ParserError, ValueError) as e:
+            self.logger.error(f"Error parsing listing page {url}: {e}")
+            return []
 
+        # Keyed on event ID, since the same event may appear multiple times
+        # on the page; the first link wins and keeps its position
+        event_links: Dict[int, EventLink] = {}
+        base_url = self.base_url
+        match_path = self.EVENT_LINK_PATTERN.match
+        for href in self.EVENT_LINK_XPATH(tree, base_url=base_url):
+            # Build full URL if href is relative
+            if href.startswith('/'):
+                path, full_url = href, base_url + href
+            else:
+                path, full_url = href[len(base_url):], href
+
+            match = match_path(path)
+            if not match:
+                continue
+
+            event_id = int(match.group(1))
+            if event_id in event_links:
+                continue
+
+            event_links[event_id] = EventLink(event_id, match.group(2), full_url)
+
+        unique_links = list(event_links.values())
         self.logger.info(
             f"Found {len(unique_links)} unique events for {month} in {province}"
         )
@@ -0,0 +1,63 @@
+"""Async rate limiter shared between scrapers."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token bucket with a single token that spaces out request starts.
+
+    Each caller reserves the next free slot under a lock and then sleeps
+    outside of it, so waiting requests don't block each other from
+    queueing up. Used as an async context manager, it also bounds the
+    number of requests in flight. Share one instance between scrapers to
+    enforce a single request rate and concurrency against the target host.
+    """
+
+    def __init__(self, delay_seconds: float, max_in_flight: Optional[int] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            delay_seconds: Minimum delay between two request starts.
+            max_in_flight: Maximum number of requests inside the context
+                           manager at the same time. Unbounded if None.
+        """
+        self.delay_seconds = delay_seconds
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = asyncio.Lock()
+        self._next_slot: float = 0
+        self._sema = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+
+    async def acquire(self) -> None:
+        """Wait until the next request is allowed to start."""
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay_seconds
+
+        sleep_time = slot - now
+        if sleep_time > 0:
+            self.logger.debug("Rate limiting: sleeping %.2fs", sleep_time)
+            await asyncio.sleep(sleep_time)
+
+    async def __aenter__(self) -> 'RateLimiter':
+        # Wait for a free request slot before reserving a start time, so
+        # queued requests don't use up the spacing while they wait
+        if self._sema:
+            await self._sema.acquire()
+        try:
+            await self.acquire()
+        except BaseException:
+            if self._sema:
+                self._sema.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._sema:
+            self._sema.release()
+        return None
@@ -1,18 +1,97 @@
 """SQLite database operations for rommelmarkt data."""
 
+import atexit
 import json
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Set
 
 from ..models.event import Event
 
 
+# Stored in the database's user_version once the schema has been applied.
+# Bump it when the schema changes, so existing databases are upgraded.
+SCHEMA_VERSION = 1
+
+# The journal mode is stored in the database file, so it is set once
+JOURNAL_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+"""
+
+# Per-connection settings: relaxed fsync (safe under WAL), a larger page
+# cache, memory-mapped I/O and a wait on locks instead of failing at once
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+    PRAGMA busy_timeout = 5000;
+"""
+
+
 class Database:
     """SQLite database handler for rommelmarkt events."""
 
+    # Stored columns in select order, used as the keys of event dicts;
+    # the generated gemeente_norm is left out
+    _COLUMNS = (
+        'id', 'naam', 'gemeente', 'postcode', 'adres', 'locatie_naam',
+        'datum', 'start_tijd', 'eind_tijd', 'types',
+        'inkom_prijs', 'standplaats_prijs',
+        'organisator', 'telefoon', 'email', 'website',
+        'beschrijving', 'afbeelding_url', 'source_url',
+        'first_scraped_at', 'last_updated_at',
+    )
+
+    # Statements are kept as constants and passed unchanged on every call,
+    # so the connection's statement cache reuses their compiled form
+    _SQL_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM events "
+    _SQL_GET = _SQL_SELECT + "WHERE id = ?"
+    _SQL_INSERT = """
+        INSERT INTO events (
+            id, naam, gemeente, postcode, adres, locatie_naam,
+            datum, start_tijd, eind_tijd, types,
+            inkom_prijs, standplaats_prijs,
+            organisator, telefoon, email, website,
+            beschrijving, afbeelding_url, source_url
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_UPSERT = _SQL_INSERT + """
+        ON CONFLICT(id) DO UPDATE SET
+            naam = excluded.naam,
+            gemeente = excluded.gemeente,
+            postcode = excluded.postcode,
+            adres = excluded.adres,
+            locatie_naam = excluded.locatie_naam,
+            datum = excluded.datum,
+            start_tijd = excluded.start_tijd,
+            eind_tijd = excluded.eind_tijd,
+            types = excluded.types,
+            inkom_prijs = excluded.inkom_prijs,
+            standplaats_prijs = excluded.standplaats_prijs,
+            organisator = excluded.organisator,
+            telefoon = excluded.telefoon,
+            email = excluded.email,
+            website = excluded.website,
+            beschrijving = excluded.beschrijving,
+            afbeelding_url = excluded.afbeelding_url,
+            source_url = excluded.source_url,
+            last_updated_at = CURRENT_TIMESTAMP
+    """
+    _SQL_ALL_IDS = "SELECT id FROM events"
+    _SQL_GET_ALL = _SQL_SELECT + "ORDER BY datum, id"
+    _SQL_BY_GEMEENTE = _SQL_SELECT + "WHERE gemeente_norm = lower(trim(?)) ORDER BY datum, id"
+    _SQL_BY_DATE_RANGE = _SQL_SELECT + "WHERE datum BETWEEN ? AND ? ORDER BY datum, id"
+    _SQL_COUNT = "SELECT COUNT(*) FROM events"
+    _SQL_TABLE_COLUMNS = "SELECT name FROM pragma_table_xinfo('events')"
+    _SQL_ADD_GEMEENTE_NORM = """
+        ALTER TABLE events ADD COLUMN gemeente_norm TEXT
+            GENERATED ALWAYS AS (lower(trim(gemeente))) VIRTUAL
+    """
+
     def __init__(self, db_path: str, schema_path: str = "schema.sql"):
         """
         Initialize database connection and schema.
@@ -25,24 +104,60 @@ class Database:
         self.schema_path = Path(schema_path)
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # In-memory databases have no journal file or pages to map
+        self.in_memory = db_path == ':memory:'
+
         # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One long-lived connection, shared by all methods. Writes run in a
+        # worker thread, so access is serialized by a lock rather than
+        # restricted to the creating thread.
+        self._conn = sqlite3.connect(
+            db_path if self.in_memory else self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        if not self.in_memory:
+            self._conn.executescript(CONNECTION_PRAGMAS)
+        self._lock = threading.RLock()
+        atexit.register(self.close)
 
         # Initialize schema
         self._init_schema()
 
+        # IDs of all stored events, kept in sync by the upsert methods;
+        # assumes this instance is the only writer while it is open
+        with self._get_connection() as conn:
+            self._exists_cache: Set[int] = {
+                row[0] for row in conn.execute(self._SQL_ALL_IDS)
+            }
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Context manager for exclusive use of the shared connection."""
+        with self._lock:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
     def _init_schema(self) -> None:
-        """Initialize database schema from SQL file."""
+        """
+        Initialize database schema from SQL file.
+
+        Databases already at SCHEMA_VERSION are left as they are, without
+        reading or running the schema.
+        """
+        with self._get_connection() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                self.logger.debug("Database schema is up to date")
+                return
+
         if self.schema_path.exists():
             with open(self.schema_path, 'r', encoding='utf-8') as f:
                 schema_sql = f.read()
@@ -70,16 +185,30 @@ class Database:
                     afbeelding_url TEXT,
                     source_url TEXT,
                     first_scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    last_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    gemeente_norm TEXT
+                        GENERATED ALWAYS AS (lower(trim(gemeente))) VIRTUAL
                 );
-                CREATE INDEX IF NOT EXISTS idx_events_datum ON events(datum);
-                CREATE INDEX IF NOT EXISTS idx_events_gemeente ON events(gemeente);
+                DROP INDEX IF EXISTS idx_events_datum;
+                DROP INDEX IF EXISTS idx_events_gemeente;
+                CREATE INDEX IF NOT EXISTS idx_events_datum_id_covering
+                    ON events(datum, id, naam, gemeente, postcode);
+                CREATE INDEX IF NOT EXISTS idx_events_gemeente_norm
+                    ON events(gemeente_norm, datum);
                 CREATE INDEX IF NOT EXISTS idx_events_postcode ON events(postcode);
             """
 
         with self._get_connection() as conn:
+            # Tables created before gemeente_norm existed get the column
+            # added first, so the schema can index it
+            columns = {row[0] for row in conn.execute(self._SQL_TABLE_COLUMNS)}
+            if columns and 'gemeente_norm' not in columns:
+                conn.execute(self._SQL_ADD_GEMEENTE_NORM)
             conn.executescript(schema_sql)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             conn.commit()
+            if not self.in_memory:
+                conn.executescript(JOURNAL_PRAGMAS)
             self.logger.debug("Database schema initialized")
 
     def event_exists(self, event_id: int) -> bool:
@@ -92,12 +221,7 @@ class Database:
         Returns:
             True if event exists, False otherwise.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM events WHERE id = ?",
-                (event_id,)
-            )
-            return cursor.fetchone() is not None
+        return event_id in self._exists_cache
 
     def get_event(self, event_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -110,10 +234,7 @@ class Database:
             Event as dictionary, or None if not found.
         """
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM events WHERE id = ?",
-                (event_id,)
-            )
+            cursor = conn.execute(self._SQL_GET, (event_id,))
             row = cursor.fetchone()
             if row:
                 return self._row_to_dict(row)
@@ -127,69 +248,61 @@ class Database:
             event: Event object to save.
         """
         with self._get_connection() as conn:
-            # Check if exists for proper timestamp handling
-            exists = self.event_exists(event.id)
-
-            if exists:
-                # Update existing record
-                conn.execute("""
-                    UPDATE events SET
-                        naam = ?,
-                        gemeente = ?,
-                        postcode = ?,
-                        adres = ?,
-                        locatie_naam = ?,
-                        datum = ?,
-                        start_tijd = ?,
-                        eind_tijd = ?,
-                        types = ?,
-                        inkom_prijs = ?,
-                        standplaats_prijs = ?,
-                        organisator = ?,
-                        telefoon = ?,
-                        email = ?,
-                        website = ?,
-                        beschrijving = ?,
-                        afbeelding_url = ?,
-                        source_url = ?,
-                        last_updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (
-                    event.naam,
-                    event.gemeente,
-                    event.postcode,
-                    event.adres,
-                    event.locatie_naam,
-                    event.datum.isoformat() if event.datum else None,
-                    event.start_tijd,
-                    event.eind_tijd,
-                    json.dumps(event.types) if event.types else '[]',
-                    float(event.inkom_prijs) if event.inkom_prijs is not None else None,
-                    float(event.standplaats_prijs) if event.standplaats_prijs is not None else None,
-                    event.organisator,
-                    event.telefoon,
-                    event.email,
-                    event.website,
-                    event.beschrijving,
-                    event.afbeelding_url,
-                    event.source_url,
-                    event.id
-                ))
-                self.logger.debug(f"Updated event {event.id}: {event.naam}")
-            else:
-                # Insert new record
-                conn.execute("""
-                    INSERT INTO events (
-                        id, naam, gemeente, postcode, adres, locatie_naam,
-                        datum, start_tijd, eind_tijd, types,
-                        inkom_prijs, standplaats_prijs,
-                        organisator, telefoon, email, website,
-                        beschrijving, afbeelding_url, source_url
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, event.to_db_tuple())
-                self.logger.debug(f"Inserted event {event.id}: {event.naam}")
+            # Updates keep first_scraped_at and refresh last_updated_at
+            conn.execute(self._SQL_UPSERT, event.to_db_tuple())
+            self._exists_cache.add(event.id)
+            self.logger.debug("Upserted event %s: %s", event.id, event.naam)
+
+    def get_all_event_ids(self) -> Set[int]:
+        """
+        Get the IDs of all stored events.
 
+        Returns:
+            Set of event IDs.
+        """
+        return set(self._exists_cache)
+
+    def upsert_events(self, events: Iterable[Event]) -> None:
+        """
+        Insert or update multiple events in a single transaction.
+
+        The write lock is taken up front (BEGIN IMMEDIATE), so the batch
+        can't fail halfway on a lock held by another connection.
+
+        Args:
+            events: Event objects to save.
+        """
+        rows = Event.batch_to_db_rows(events)
+        if not rows:
+            return
+
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(self._SQL_UPSERT, rows)
+            except sqlite3.Error:
+                conn.rollback()
+                raise
             conn.commit()
+            self._exists_cache.update(row[0] for row in rows)
+            self.logger.debug("Upserted batch of %d events", len(rows))
+
+    def iter_all_events(self, parse_json: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all events as dictionaries, one row at a time.
+
+        The connection is held until the iteration is finished.
+
+        Args:
+            parse_json: Decode JSON columns (types). If False, they are
+                        yielded as the JSON text stored in the database.
+
+        Yields:
+            Events as dictionaries, ordered by date.
+        """
+        with self._get_connection() as conn:
+            for row in conn.execute(self._SQL_GET_ALL):
+                yield self._row_to_dict(row, parse_json)
 
     def get_all_events(self) -> List[Dict[str, Any]]:
         """
@@ -199,15 +312,16 @@ class Database:
             List of events as dictionaries.
         """
         with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM events ORDER BY datum"
-            )
+            cursor = conn.execute(self._SQL_GET_ALL)
             return [self._row_to_dict(row) for row in cursor.fetchall()]
 
     def get_events_by_gemeente(self, gemeente: str) -> List[Dict[str, Any]]:
         """
         Get events filtered by municipality.
 
+        Matches the full name, ignoring case and surrounding whitespace,
+        against the indexed gemeente_norm column.
+
         Args:
             gemeente: Municipality name to filter by.
 
@@ -216,8 +330,8 @@ class Database:
         """
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM events WHERE gemeente LIKE ? ORDER BY datum",
-                (f"%{gemeente}%",)
+                self._SQL_BY_GEMEENTE,
+                (gemeente,)
             )
             return [self._row_to_dict(row) for row in cursor.fetchall()]
 
@@ -238,7 +352,7 @@ class Database:
         """
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM events WHERE datum BETWEEN ? AND ? ORDER BY datum",
+                self._SQL_BY_DATE_RANGE,
                 (start_date, end_date)
             )
             return [self._row_to_dict(row) for row in cursor.fetchall()]
@@ -246,14 +360,14 @@ class Database:
     def get_event_count(self) -> int:
         """Get total number of events in database."""
         with self._get_connection() as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM events")
+            cursor = conn.execute(self._SQL_COUNT)
             return cursor.fetchone()[0]
 
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
-        """Convert SQLite Row to dictionary with JSON parsing."""
-        d = dict(row)
+    def _row_to_dict(self, row: tuple, parse_json: bool = True) -> Dict[str, Any]:
+        """Convert a selected row to dictionary, optionally parsing JSON fields."""
+        d = dict(zip(self._COLUMNS, row))
         # Parse JSON fields
-        if d.get('types'):
+        if parse_json and d.get('types'):
             try:
                 d['types'] = json.loads(d['types'])
             except json.JSONDecodeError:
@@ -1,14 +1,69 @@
 """JSON export functionality for rommelmarkt data."""
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional
+
+import orjson
 
 from .database import Database
 
 
+def _write_export(
+    f: BinaryIO,
+    metadata: Dict[str, Any],
+    events: Iterable[Dict[str, Any]]
+) -> int:
+    """
+    Write an export document without holding all events in memory.
+
+    The output is identical to orjson.dumps({'metadata': ..., 'events': [...]})
+    with OPT_INDENT_2; each event is serialized and indented on its own.
+
+    Args:
+        f: File opened in binary mode.
+        metadata: Export metadata.
+        events: Events to write.
+
+    Returns:
+        Number of events written.
+    """
+    header = orjson.dumps({'metadata': metadata}, option=orjson.OPT_INDENT_2)
+    # Reopen the top-level object after the metadata member
+    f.write(header[:-2] + b',\n  "events": [')
+
+    count = 0
+    for event in events:
+        body = orjson.dumps(event, option=orjson.OPT_INDENT_2, default=str)
+        f.write(b',\n    ' if count else b'\n    ')
+        f.write(body.replace(b'\n', b'\n    '))
+        count += 1
+
+    f.write(b'\n  ]\n}' if count else b']\n}')
+    return count
+
+
+def _raw_types(events: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Mark the stored types JSON of each event for verbatim output.
+
+    Args:
+        events: Events with types still as JSON text.
+
+    Yields:
+        The same events, with types wrapped in an orjson.Fragment. Types
+        that are not a JSON array are exported as an empty list.
+    """
+    for event in events:
+        types = event['types']
+        if types:
+            # The column is written by models.event._types_json; anything else
+            # would be copied into the export as invalid JSON
+            event['types'] = orjson.Fragment(types) if types.startswith('[') else []
+        yield event
+
+
 def export_to_json(
     db: Database,
     export_path: str,
@@ -39,24 +94,19 @@ def export_to_json(
 
     filepath = export_dir / filename
 
-    # Get all events
-    events = db.get_all_events()
-
-    # Create export structure
-    export_data = {
-        'metadata': {
-            'exported_at': datetime.now().isoformat(),
-            'total_events': len(events),
-            'source': 'rommelmarkten.be'
-        },
-        'events': events
+    metadata = {
+        'exported_at': datetime.now().isoformat(),
+        'total_events': db.get_event_count(),
+        'source': 'rommelmarkten.be'
     }
 
-    # Write to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, ensure_ascii=False, indent=2, default=str)
+    # Stream events from the database into the file, one at a time. The
+    # types column is already JSON, so it is copied instead of re-encoded.
+    with open(filepath, 'wb') as f:
+        events = _raw_types(db.iter_all_events(parse_json=False))
+        count = _write_export(f, metadata, events)
 
-    logger.info(f"Exported {len(events)} events to {filepath}")
+    logger.info(f"Exported {count} events to {filepath}")
     return str(filepath)
 
 
@@ -126,8 +176,9 @@ def export_filtered_to_json(
     }
 
     # Write to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, ensure_ascii=False, indent=2, default=str)
+    filepath.write_bytes(
+        orjson.dumps(export_data, option=orjson.OPT_INDENT_2, default=str)
+    )
 
     logger.info(f"Exported {len(events)} filtered events to {filepath}")
     return str(filepath)
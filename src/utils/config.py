@@ -2,10 +2,19 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Directories already created by load_config in this process
+_ENSURED_DIRS: Set[Path] = set()
+
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
@@ -27,7 +36,7 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_file, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
 
     # Ensure required sections exist with defaults
     config.setdefault('scraping', {})
@@ -38,6 +47,7 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     # Set scraping defaults
     scraping = config['scraping']
     scraping.setdefault('delay_seconds', 2.5)
+    scraping.setdefault('concurrency', 4)
     scraping.setdefault('max_retries', 3)
     scraping.setdefault('retry_delay_seconds', 5)
     scraping.setdefault('user_agent', 'RommelmarktZoeker/1.0')
@@ -56,6 +66,7 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     storage = config['storage']
     storage.setdefault('database_path', 'data/rommelmarkten.db')
     storage.setdefault('json_export_path', 'data/exports')
+    storage.setdefault('http_cache_path', 'data/http_cache.db')
 
     # Set logging defaults
     logging_config = config['logging']
@@ -68,7 +79,8 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     log_dir = Path(logging_config['file']).parent if logging_config['file'] else None
 
     for directory in [db_dir, export_dir, log_dir]:
-        if directory:
+        if directory and directory not in _ENSURED_DIRS:
             directory.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(directory)
 
     return config
@@ -1,18 +1,39 @@
 """Logging configuration for rommelmarkt scraper."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 
+# Background thread that writes queued records to the real handlers
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def setup_logging(config: Dict[str, Any]) -> None:
     """
     Configure logging based on configuration.
 
+    Records are put on a queue by the logging call and written to the
+    console and log file by a background thread, so logging never blocks
+    on I/O.
+
     Args:
         config: Logging configuration dictionary with 'level' and 'file' keys.
     """
+    global _listener
+
     level_str = config.get('level', 'INFO').upper()
     log_file = config.get('file')
 
@@ -38,12 +59,13 @@ def setup_logging(config: Dict[str, Any]) -> None:
 
     # Remove existing handlers
     root_logger.handlers.clear()
+    _stop_listener()
 
     # Add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # Add file handler if configured
     if log_file:
@@ -53,8 +75,17 @@ def setup_logging(config: Dict[str, Any]) -> None:
         file_handler = logging.FileHandler(log_path, encoding='utf-8')
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Hand records to the handlers through a queue
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Reduce noise from third-party libraries
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    logging.getLogger('httpcore').setLevel(logging.WARNING)
+
+
+atexit.register(_stop_listener)
@@ -0,0 +1,76 @@
+"""Tests for the retry and concurrency behaviour of the base scraper."""
+
+import asyncio
+
+import httpx
+
+from src.scraper.base import BaseScraper
+from src.scraper.rate_limiter import RateLimiter
+
+
+def fetch_with_responses(responses):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    # A long backoff, so a retry that ignores Retry-After times out
+    scraper = BaseScraper(
+        {'delay_seconds': 0, 'retry_delay_seconds': 60, 'max_retries': 1},
+        client=client
+    )
+
+    async def run():
+        try:
+            return await asyncio.wait_for(scraper.fetch('https://example.com/'), 5)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run()), requests
+
+
+def test_retry_honours_retry_after_seconds():
+    html, requests = fetch_with_responses([
+        httpx.Response(429, headers={'Retry-After': '0'}),
+        httpx.Response(200, text='<html>ok</html>'),
+    ])
+
+    assert html == '<html>ok</html>'
+    assert len(requests) == 2
+
+
+def test_retry_honours_retry_after_date():
+    html, requests = fetch_with_responses([
+        httpx.Response(503, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+        httpx.Response(200, text='<html>ok</html>'),
+    ])
+
+    assert html == '<html>ok</html>'
+    assert len(requests) == 2
+
+
+def test_shared_limiter_bounds_requests_across_scrapers():
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text='<html></html>')
+
+    async def run():
+        config = {'delay_seconds': 0, 'concurrency': 2}
+        limiter = RateLimiter(0, 2)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scrapers = [BaseScraper(config, limiter, client) for _ in range(2)]
+            await asyncio.gather(*(
+                scraper.fetch(f'https://example.com/{i}')
+                for scraper in scrapers for i in range(4)
+            ))
+
+    asyncio.run(run())
+    assert peak == 2
@@ -0,0 +1,46 @@
+"""Tests for text field extraction from event detail pages."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.scraper.detail_scraper import DetailScraper
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+URL = 'https://www.rommelmarkten.be/rommelmarkt/100/foo-olen'
+
+
+@pytest.fixture
+def scraper():
+    return DetailScraper({'base_url': 'https://www.rommelmarkten.be', 'delay_seconds': 0})
+
+
+def parse_fixture(scraper, name):
+    html = (FIXTURES / name).read_text(encoding='utf-8')
+    event = scraper.parse_detail_page(html, URL, 100)
+    assert event is not None
+    return event
+
+
+def test_date_and_times_on_organisator_line(scraper):
+    event = parse_fixture(scraper, 'detail_organisator_datum.html')
+
+    assert event.organisator is not None
+    assert event.datum == date(2026, 4, 12)
+    assert event.start_tijd == '8:00'
+    assert event.eind_tijd == '14:00'
+
+
+def test_phone_on_organisator_line(scraper):
+    event = parse_fixture(scraper, 'detail_organisator_telefoon.html')
+
+    assert event.organisator == 'Jan Peeters 0470 12 34 56'
+    assert event.telefoon == '0470 12 34 56'
+
+
+def test_email_on_organisator_line(scraper):
+    event = parse_fixture(scraper, 'detail_organisator_email.html')
+
+    assert event.email == 'jan@voorbeeld.be'
@@ -0,0 +1,41 @@
+"""Tests for event link extraction from listing pages."""
+
+import asyncio
+from pathlib import Path
+
+from src.scraper.listing_scraper import ListingScraper
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+BASE_URL = 'https://www.rommelmarkten.be'
+
+
+def scrape_fixture(name):
+    html = (FIXTURES / name).read_text(encoding='utf-8')
+    scraper = ListingScraper({'base_url': BASE_URL, 'delay_seconds': 0})
+
+    async def fetch(url):
+        return html
+
+    scraper.fetch = fetch
+    return asyncio.run(scraper.scrape_listing_page('oost-vlaanderen', 'april'))
+
+
+def test_only_on_site_links_are_accepted():
+    links = scrape_fixture('listing_share_links.html')
+
+    assert [(link.id, link.slug, link.url) for link in links] == [
+        (555, 'foo-gent', f'{BASE_URL}/rommelmarkt/555/foo-gent'),
+        (556, 'bar-olen', f'{BASE_URL}/rommelmarkt/556/bar-olen'),
+    ]
+
+
+def test_unparseable_page_yields_no_links():
+    scraper = ListingScraper({'base_url': BASE_URL, 'delay_seconds': 0})
+
+    for body in ('   ', '<?xml version="1.0" encoding="utf-8"?><html></html>'):
+        async def fetch(url):
+            return body
+
+        scraper.fetch = fetch
+        assert asyncio.run(scraper.scrape_listing_page('limburg', 'mei')) == []